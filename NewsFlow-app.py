@@ -10,11 +10,15 @@ Uso: python NewsFlow-app.py
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from db import init_db, insert_articles_batch
+import requests
+
+from db import init_db, insert_articles_batch, close_connection
 from sources.globaltimes import collect_globaltimes_china
 from sources.xinhua_chinabiz import collect_xinhua_chinabiz
 from sources.scmp_china import collect_scmp_china
+from sources.http_session import get_session, close_session
 from export_articles_html import export_newsflow_all
 
 logging.basicConfig(
@@ -33,25 +37,44 @@ SOURCES = [
 ]
 
 
+def _run_source(source_id: str, display_name: str, collect_fn, session: requests.Session) -> list[dict]:
+    """Roda o coletor de uma fonte (executado numa thread do pool)."""
+    logger.info("Coletando: %s", display_name)
+    articles = collect_fn(session=session)
+    logger.info("  Coleta concluída: %s (%d artigos)", display_name, len(articles or []))
+    return articles
+
+
 def main():
     logger.info("NewsFlow-app: iniciando coleta de todas as fontes")
     init_db()
+    try:
+        # Coletas em paralelo (I/O de rede); gravação no banco só nesta thread,
+        # à medida que cada fonte termina.
+        session = get_session()
+        with ThreadPoolExecutor(max_workers=len(SOURCES)) as executor:
+            futures = {
+                executor.submit(_run_source, source_id, display_name, collect_fn, session): (source_id, display_name)
+                for source_id, display_name, collect_fn in SOURCES
+            }
+            for future in as_completed(futures):
+                source_id, display_name = futures[future]
+                try:
+                    articles = future.result()
+                    if not articles:
+                        logger.warning("  Nenhum artigo: %s", display_name)
+                        continue
+                    n = insert_articles_batch(source_id, articles)
+                    logger.info("  Salvos %d artigos (%s)", n, source_id)
+                except Exception as e:
+                    logger.exception("  Erro ao coletar %s: %s", display_name, e)
 
-    for source_id, display_name, collect_fn in SOURCES:
-        try:
-            logger.info("Coletando: %s", display_name)
-            articles = collect_fn()
-            if not articles:
-                logger.warning("  Nenhum artigo: %s", display_name)
-                continue
-            n = insert_articles_batch(source_id, articles)
-            logger.info("  Salvos %d artigos (%s)", n, source_id)
-        except Exception as e:
-            logger.exception("  Erro ao coletar %s: %s", display_name, e)
-
-    logger.info("Gerando index.html (todas as fontes, tradução PT)...")
-    sources_for_export = [(sid, name) for sid, name, _ in SOURCES]
-    export_newsflow_all(sources_for_export, hours=24, translate=True)
+        logger.info("Gerando index.html (todas as fontes, tradução PT)...")
+        sources_for_export = [(sid, name) for sid, name, _ in SOURCES]
+        export_newsflow_all(sources_for_export, hours=24, translate=True)
+    finally:
+        close_session()
+        close_connection()
     logger.info("NewsFlow-app: concluído")
 
 
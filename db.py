@@ -5,59 +5,246 @@ Permite consultar notícias antigas no futuro.
 
 import sqlite3
 import logging
-from datetime import datetime
+from datetime import datetime, timezone, timedelta
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from config import DB_PATH
 
 logger = logging.getLogger(__name__)
 
+# PRAGMAs por conexão (não persistem no arquivo): fsync só no checkpoint do WAL,
+# temporários em memória, cache de 64 MB e leitura via mmap (256 MB).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
 
-def get_connection():
-    """Retorna conexão com o banco (path criado se não existir)."""
-    Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
-    return sqlite3.connect(DB_PATH)
+# Upserts: artigo já existente só é reescrito se algum campo mudou (ou se passou a ser
+# principal), então reexecuções com o mesmo conteúdo não sujam páginas nem crescem o WAL.
+# A última coleta por fonte fica em source_state; o scraped_at do artigo pode ficar como está.
+UPSERT_ARTICLE_SQL = """
+    INSERT INTO articles (source, url, title, summary, category, published_at, author, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source, url) DO UPDATE SET
+        title = excluded.title,
+        summary = excluded.summary,
+        category = excluded.category,
+        published_at = excluded.published_at,
+        author = excluded.author,
+        scraped_at = excluded.scraped_at
+    WHERE articles.title IS NOT excluded.title
+        OR articles.summary IS NOT excluded.summary
+        OR articles.category IS NOT excluded.category
+        OR articles.published_at IS NOT excluded.published_at
+        OR articles.author IS NOT excluded.author
+"""
+
+INSERT_ARTICLE_SQL = """
+    INSERT INTO articles (source, url, title, summary, category, published_at, author, scraped_at, is_principal)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source, url) DO UPDATE SET
+        title = excluded.title,
+        summary = excluded.summary,
+        category = excluded.category,
+        published_at = excluded.published_at,
+        author = excluded.author,
+        scraped_at = excluded.scraped_at,
+        is_principal = CASE WHEN excluded.is_principal = 1 THEN 1 ELSE is_principal END
+    WHERE articles.title IS NOT excluded.title
+        OR articles.summary IS NOT excluded.summary
+        OR articles.category IS NOT excluded.category
+        OR articles.published_at IS NOT excluded.published_at
+        OR articles.author IS NOT excluded.author
+        OR (excluded.is_principal = 1 AND articles.is_principal = 0)
+"""
+
+UPDATE_SOURCE_STATE_SQL = """
+    INSERT INTO source_state (source, last_scraped) VALUES (?, ?)
+    ON CONFLICT(source) DO UPDATE SET last_scraped = excluded.last_scraped
+"""
+
+LAST_SCRAPED_SQL = "SELECT last_scraped FROM source_state WHERE source = ?"
+
+# published_at é ISO-8601 (UTC): comparação de strings == comparação cronológica
+NEWSFLOW_SQL = """
+    SELECT source, url, title, summary, category, published_at, author, is_principal
+    FROM articles
+    WHERE source = ? AND published_at IS NOT NULL AND published_at >= ?
+    ORDER BY published_at DESC, id DESC
+"""
+
+# Conteúdo atual de artigos já gravados (para comparar com o lote antes do upsert)
+EXISTING_ARTICLES_SQL = """
+    SELECT url, title, summary, category, published_at, author, is_principal
+    FROM articles
+    WHERE source = ? AND url IN ({urls})
+"""
+
+# Máximo de parâmetros por consulta IN (abaixo do limite de variáveis do SQLite)
+_IN_CHUNK = 500
+
+# Variantes multi-fonte: o placeholder {sources} recebe "?, ?, ..." (um por fonte)
+NEWSFLOW_MULTI_SQL = """
+    SELECT source, url, title, summary, category, published_at, author, is_principal
+    FROM articles
+    WHERE source IN ({sources}) AND published_at IS NOT NULL AND published_at >= ?
+    ORDER BY source, published_at DESC, id DESC
+"""
+
+LAST_SCRAPED_MULTI_SQL = "SELECT source, last_scraped FROM source_state WHERE source IN ({sources})"
+
+GET_TRANSLATIONS_SQL = """
+    SELECT url, field, src_hash, translated FROM translations
+    WHERE source = ? AND url IN ({urls})
+"""
+
+UPSERT_TRANSLATION_SQL = """
+    INSERT INTO translations (source, url, field, src_hash, translated, ts)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source, url, field) DO UPDATE SET
+        src_hash = excluded.src_hash,
+        translated = excluded.translated,
+        ts = excluded.ts
+"""
+
+# Cache de traduções por texto (independe do artigo): src_hash do texto original + idioma destino
+GET_STRING_TRANSLATIONS_SQL = """
+    SELECT src_hash, translated FROM translation_strings
+    WHERE lang = ? AND src_hash IN ({hashes})
+"""
+
+SAVE_STRING_TRANSLATION_SQL = """
+    INSERT OR REPLACE INTO translation_strings (src_hash, lang, translated, ts)
+    VALUES (?, ?, ?, ?)
+"""
+
+# Traduções (por artigo e por texto) mais antigas que isso são descartadas no init_db
+TRANSLATION_CACHE_DAYS = 90
+
+# Acima deste número de linhas, bulk_import recria os índices secundários só no fim
+BULK_IMPORT_THRESHOLD = 10_000
+
+# Conexão única do processo (aberta sob demanda por get_connection)
+_CONN: sqlite3.Connection | None = None
+
+
+def get_connection() -> sqlite3.Connection:
+    """Retorna a conexão compartilhada com o banco (path criado se não existir)."""
+    global _CONN
+    if _CONN is None:
+        Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        _CONN = conn
+    return _CONN
+
+
+def close_connection() -> None:
+    """Fecha a conexão compartilhada (a próxima chamada a get_connection reabre)."""
+    global _CONN
+    if _CONN is not None:
+        _CONN.close()
+        _CONN = None
 
 
 def init_db():
     """Cria a tabela de artigos se não existir."""
     conn = get_connection()
-    try:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                source TEXT NOT NULL,
-                url TEXT NOT NULL,
-                title TEXT NOT NULL,
-                summary TEXT,
-                category TEXT,
-                published_at TEXT,
-                author TEXT,
-                scraped_at TEXT NOT NULL,
-                is_principal INTEGER NOT NULL DEFAULT 0,
-                UNIQUE(source, url)
-            )
-        """)
-        # Migração: adicionar is_principal se a tabela já existia sem a coluna
-        cur = conn.execute("PRAGMA table_info(articles)")
-        cols = [row[1] for row in cur.fetchall()]
-        if "is_principal" not in cols:
-            conn.execute("ALTER TABLE articles ADD COLUMN is_principal INTEGER NOT NULL DEFAULT 0")
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)"
+    # WAL fica gravado no arquivo do banco: basta ativar uma vez
+    mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    if mode.lower() != "wal":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source TEXT NOT NULL,
+            url TEXT NOT NULL,
+            title TEXT NOT NULL,
+            summary TEXT,
+            category TEXT,
+            published_at TEXT,
+            author TEXT,
+            scraped_at TEXT NOT NULL,
+            is_principal INTEGER NOT NULL DEFAULT 0,
+            UNIQUE(source, url)
         )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_articles_is_principal ON articles(is_principal)"
+    """)
+    # Migração: adicionar is_principal se a tabela já existia sem a coluna
+    cur = conn.execute("PRAGMA table_info(articles)")
+    cols = [row[1] for row in cur.fetchall()]
+    if "is_principal" not in cols:
+        conn.execute("ALTER TABLE articles ADD COLUMN is_principal INTEGER NOT NULL DEFAULT 0")
+    # Última coleta por fonte (evita max(scraped_at) sobre todos os artigos a cada export)
+    has_source_state = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'source_state'"
+    ).fetchone()
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS source_state (
+            source TEXT PRIMARY KEY,
+            last_scraped TEXT NOT NULL
         )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at)"
+    """)
+    if not has_source_state:
+        # Migração: preencher a partir dos artigos já gravados
+        conn.execute("""
+            INSERT INTO source_state (source, last_scraped)
+            SELECT source, max(scraped_at) FROM articles GROUP BY source
+        """)
+    # Cache de traduções por artigo/campo; src_hash identifica o texto original traduzido
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS translations (
+            source TEXT NOT NULL,
+            url TEXT NOT NULL,
+            field TEXT NOT NULL,
+            src_hash TEXT NOT NULL,
+            translated TEXT NOT NULL,
+            ts INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (source, url, field)
         )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)"
+    """)
+    # Migração: adicionar ts (data da tradução) se a tabela já existia sem a coluna
+    cur = conn.execute("PRAGMA table_info(translations)")
+    if "ts" not in [row[1] for row in cur.fetchall()]:
+        conn.execute("ALTER TABLE translations ADD COLUMN ts INTEGER NOT NULL DEFAULT 0")
+        conn.execute("UPDATE translations SET ts = ?", (int(datetime.now(timezone.utc).timestamp()),))
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS translation_strings (
+            src_hash TEXT NOT NULL,
+            lang TEXT NOT NULL,
+            translated TEXT NOT NULL,
+            ts INTEGER NOT NULL,
+            PRIMARY KEY (src_hash, lang)
         )
-        conn.commit()
-    finally:
-        conn.close()
+    """)
+    expire_before = int((datetime.now(timezone.utc) - timedelta(days=TRANSLATION_CACHE_DAYS)).timestamp())
+    conn.execute("DELETE FROM translations WHERE ts < ?", (expire_before,))
+    conn.execute("DELETE FROM translation_strings WHERE ts < ?", (expire_before,))
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_is_principal ON articles(is_principal)"
+    )
+    # Newsflow filtra por source + janela de published_at: índice composto.
+    # Fica ASC: percorrido de trás para frente já entrega published_at DESC, id DESC
+    # (com DESC o planner precisaria de um sort extra para o id). Também cobre
+    # buscas só por source, então idx_articles_source sai.
+    conn.execute("DROP INDEX IF EXISTS idx_articles_source")
+    # Nenhuma consulta filtra só por url; o conflito usa UNIQUE(source, url)
+    conn.execute("DROP INDEX IF EXISTS idx_articles_url")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_src_pub ON articles(source, published_at)"
+    )
+    # published_at sozinho fica: a listagem sem filtro de fonte (list_articles,
+    # ORDER BY published_at DESC, id DESC LIMIT n) vira leitura reversa desse índice
+    # em vez de scan + sort da tabela inteira. idx_articles_pub era o mesmo índice com outro nome.
+    conn.execute("DROP INDEX IF EXISTS idx_articles_pub")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at)"
+    )
+    conn.commit()
 
 
 def _iso(dt: datetime | None) -> str | None:
@@ -78,120 +265,235 @@ def upsert_article(
 ) -> None:
     """Insere ou atualiza um artigo (por source + url)."""
     conn = get_connection()
+    scraped_at = _utc_now_iso()
+    conn.execute(
+        UPSERT_ARTICLE_SQL,
+        (
+            source,
+            url,
+            title,
+            summary or None,
+            category or None,
+            _iso(published_at),
+            author or None,
+            scraped_at,
+        ),
+    )
+    conn.execute(UPDATE_SOURCE_STATE_SQL, (source, scraped_at))
+    conn.commit()
+
+
+def _utc_now_iso() -> str:
+    """Data/hora atual em UTC, ISO sem fuso (mesmo formato de published_at)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="seconds")
+
+
+def _article_rows(source: str, articles: list[dict], scraped_at: str) -> list[tuple]:
+    """Monta as tuplas de parâmetros de INSERT_ARTICLE_SQL para os artigos de uma fonte."""
+    dt_cls = datetime
+    rows = []
+    append = rows.append
+    for a in articles:
+        get = a.get
+        pub = get("published_at")
+        append((
+            source,
+            a["url"],
+            a["title"],
+            get("summary"),
+            get("category"),
+            pub.isoformat() if isinstance(pub, dt_cls) else pub,
+            get("author"),
+            scraped_at,
+            1 if get("is_principal") else 0,
+        ))
+    return rows
+
+
+def _changed_rows(conn: sqlite3.Connection, source: str, rows: list[tuple]) -> list[tuple]:
+    """
+    Filtra as tuplas de _article_rows, deixando só artigos novos ou com conteúdo diferente
+    do que já está no banco (inclusive os que passaram a ser principais).
+    """
+    existing: dict[str, tuple] = {}
+    urls = [r[1] for r in rows]
+    for i in range(0, len(urls), _IN_CHUNK):
+        chunk = urls[i : i + _IN_CHUNK]
+        sql = EXISTING_ARTICLES_SQL.format(urls=", ".join("?" * len(chunk)))
+        for url, *fields in conn.execute(sql, [source, *chunk]):
+            existing[url] = tuple(fields)
+    changed = []
+    for r in rows:
+        old = existing.get(r[1])
+        # r: (source, url, title, summary, category, published_at, author, scraped_at, is_principal)
+        if old is None or old[:5] != r[2:7] or (r[8] and not old[5]):
+            changed.append(r)
+    return changed
+
+
+def insert_articles_batch(source: str, articles: list[dict]) -> int:
+    """
+    Insere ou atualiza uma lista de artigos numa única transação. Artigos já gravados
+    e sem mudança são pulados antes do upsert. Retorna quantidade processada.
+    """
+    conn = get_connection()
+    scraped_at = _utc_now_iso()
+    rows = _article_rows(source, articles, scraped_at)
     try:
-        conn.execute(
-            """
-            INSERT INTO articles (source, url, title, summary, category, published_at, author, scraped_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(source, url) DO UPDATE SET
-                title = excluded.title,
-                summary = excluded.summary,
-                category = excluded.category,
-                published_at = excluded.published_at,
-                author = excluded.author,
-                scraped_at = excluded.scraped_at
-            """,
-            (
-                source,
-                url,
-                title,
-                summary or None,
-                category or None,
-                _iso(published_at),
-                author or None,
-                _iso(datetime.utcnow()),
-            ),
-        )
+        conn.execute("BEGIN IMMEDIATE")
+        changed = _changed_rows(conn, source, rows)
+        conn.executemany(INSERT_ARTICLE_SQL, changed)
+        if rows:
+            conn.execute(UPDATE_SOURCE_STATE_SQL, (source, scraped_at))
         conn.commit()
-    finally:
-        conn.close()
+    except Exception:
+        conn.rollback()
+        raise
+    logger.debug("%s: %d de %d artigos novos ou alterados", source, len(changed), len(rows))
+    return len(rows)
 
 
-def insert_articles_batch(source: str, articles: list[dict]) -> int:
-    """Insere ou atualiza uma lista de artigos. Retorna quantidade processada."""
+def bulk_import(articles_by_source: dict[str, list[dict]]) -> int:
+    """
+    Importa artigos de várias fontes ({source: [artigos]}) numa única transação.
+    Acima de BULK_IMPORT_THRESHOLD linhas, remove os índices secundários da tabela
+    articles antes dos inserts e os recria no fim (uma construção só, em vez de
+    atualizar cada B-tree a cada linha). O índice de UNIQUE(source, url) é mantido,
+    pois o ON CONFLICT depende dele. Retorna quantidade processada.
+    """
+    total = sum(len(articles) for articles in articles_by_source.values())
+    if total <= BULK_IMPORT_THRESHOLD:
+        return sum(insert_articles_batch(source, articles) for source, articles in articles_by_source.items())
+
     conn = get_connection()
-    scraped_at = _iso(datetime.utcnow())
-    count = 0
+    scraped_at = _utc_now_iso()
     try:
-        for a in articles:
-            is_principal = 1 if a.get("is_principal") else 0
-            conn.execute(
-                """
-                INSERT INTO articles (source, url, title, summary, category, published_at, author, scraped_at, is_principal)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(source, url) DO UPDATE SET
-                    title = excluded.title,
-                    summary = excluded.summary,
-                    category = excluded.category,
-                    published_at = excluded.published_at,
-                    author = excluded.author,
-                    scraped_at = excluded.scraped_at,
-                    is_principal = CASE WHEN excluded.is_principal = 1 THEN 1 ELSE is_principal END
-                """,
-                (
-                    source,
-                    a["url"],
-                    a["title"],
-                    a.get("summary"),
-                    a.get("category"),
-                    _iso(a.get("published_at")) if isinstance(a.get("published_at"), datetime) else a.get("published_at"),
-                    a.get("author"),
-                    scraped_at,
-                    is_principal,
-                ),
-            )
-            count += 1
+        conn.execute("BEGIN IMMEDIATE")
+        # Índices criados por CREATE INDEX (os automáticos de UNIQUE têm sql NULL)
+        indexes = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'articles' AND sql IS NOT NULL"
+        ).fetchall()
+        for name, _ in indexes:
+            conn.execute(f'DROP INDEX "{name}"')
+        for source, articles in articles_by_source.items():
+            conn.executemany(INSERT_ARTICLE_SQL, _article_rows(source, articles, scraped_at))
+            if articles:
+                conn.execute(UPDATE_SOURCE_STATE_SQL, (source, scraped_at))
+        for _, sql in indexes:
+            conn.execute(sql)
         conn.commit()
-    finally:
-        conn.close()
-    return count
+    except Exception:
+        conn.rollback()
+        raise
+    logger.info("Importação em lote: %d artigos (%d índices recriados)", total, len(indexes))
+    return total
 
 
 def get_last_scraped_at(source: str) -> str | None:
     """Retorna a data/hora da última coleta (scraped_at) para o source."""
-    conn = get_connection()
-    row = conn.execute(
-        "SELECT max(scraped_at) FROM articles WHERE source = ?",
-        (source,),
-    ).fetchone()
-    conn.close()
+    row = get_connection().execute(LAST_SCRAPED_SQL, (source,)).fetchone()
     return row[0] if row and row[0] else None
 
 
-def get_newsflow_articles(source: str, hours: int = 24) -> list[tuple]:
+def get_last_scraped_multi(sources: list[str]) -> dict[str, str | None]:
+    """Como get_last_scraped_at, para várias fontes numa só consulta: {source: scraped_at ou None}."""
+    result: dict[str, str | None] = dict.fromkeys(sources)
+    if not sources:
+        return result
+    sql = LAST_SCRAPED_MULTI_SQL.format(sources=", ".join("?" * len(sources)))
+    for source, last_scraped in get_connection().execute(sql, sources):
+        result[source] = last_scraped or None
+    return result
+
+
+def _newsflow_cutoff(hours: int) -> str:
+    """Início da janela do newsflow em ISO (UTC), no mesmo formato de published_at."""
+    return (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _row_cursor() -> sqlite3.Cursor:
+    """Cursor da conexão compartilhada que devolve sqlite3.Row (acesso por nome de coluna)."""
+    cur = get_connection().cursor()
+    cur.row_factory = sqlite3.Row
+    return cur
+
+
+def get_newsflow_articles(source: str, hours: int = 24) -> list[sqlite3.Row]:
     """
     Retorna artigos do newsflow: todas as notícias do source com published_at
     nas últimas `hours` horas, ordenadas por data decrescente (uma única lista, sem "destaques").
+    Cada linha é um sqlite3.Row (row["title"], row["url"], ...).
     """
-    from datetime import datetime, timezone, timedelta
+    return _row_cursor().execute(NEWSFLOW_SQL, (source, _newsflow_cutoff(hours))).fetchall()
 
+
+def get_newsflow_multi(sources: list[str], hours: int = 24) -> dict[str, list[sqlite3.Row]]:
+    """Como get_newsflow_articles, para várias fontes numa só consulta: {source: linhas}."""
+    result: dict[str, list[sqlite3.Row]] = {source: [] for source in sources}
+    if not sources:
+        return result
+    sql = NEWSFLOW_MULTI_SQL.format(sources=", ".join("?" * len(sources)))
+    cur = _row_cursor().execute(sql, [*sources, _newsflow_cutoff(hours)])
+    for source, rows in groupby(cur, key=itemgetter("source")):
+        result[source] = list(rows)
+    return result
+
+
+def get_translations(keys: list[tuple[str, str]]) -> dict[tuple[str, str, str], tuple[str, str]]:
+    """
+    Busca traduções salvas para os pares (source, url).
+    Retorna {(source, url, field): (src_hash, translated)}.
+    """
+    urls_by_source: dict[str, list[str]] = {}
+    for source, url in keys:
+        urls_by_source.setdefault(source, []).append(url)
     conn = get_connection()
-    rows = conn.execute(
-        """
-        SELECT source, url, title, summary, category, published_at, author, is_principal
-        FROM articles
-        WHERE source = ?
-        ORDER BY published_at DESC NULLS LAST, id DESC
-        """,
-        (source,),
-    ).fetchall()
-    conn.close()
-
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    result = []
-    for r in rows:
-        source_, url, title, summary, category, published_at, author, is_principal = r
-        if not published_at:
-            continue
-        try:
-            s = published_at.strip()[:19]
-            if "T" in s:
-                dt = datetime.strptime(s, "%Y-%m-%dT%H:%M:%S")
-            else:
-                dt = datetime.strptime(s[:19], "%Y-%m-%d %H:%M:%S")
-            dt = dt.replace(tzinfo=timezone.utc)
-            if dt >= cutoff:
-                result.append(r)
-        except (ValueError, TypeError):
-            pass
+    result = {}
+    for source, urls in urls_by_source.items():
+        for i in range(0, len(urls), _IN_CHUNK):
+            chunk = urls[i : i + _IN_CHUNK]
+            sql = GET_TRANSLATIONS_SQL.format(urls=", ".join("?" * len(chunk)))
+            for url, field, src_hash, translated in conn.execute(sql, [source, *chunk]):
+                result[(source, url, field)] = (src_hash, translated)
     return result
+
+
+def save_translations(entries: list[tuple[str, str, str, str, str]]) -> None:
+    """Grava traduções [(source, url, field, src_hash, translated), ...] numa única transação."""
+    if not entries:
+        return
+    ts = int(datetime.now(timezone.utc).timestamp())
+    conn = get_connection()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(UPSERT_TRANSLATION_SQL, [(*entry, ts) for entry in entries])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def get_string_translations(src_hashes: list[str], lang: str) -> dict[str, str]:
+    """Busca traduções de texto já feitas para os hashes dados. Retorna {src_hash: translated}."""
+    conn = get_connection()
+    result: dict[str, str] = {}
+    for i in range(0, len(src_hashes), _IN_CHUNK):
+        chunk = src_hashes[i : i + _IN_CHUNK]
+        sql = GET_STRING_TRANSLATIONS_SQL.format(hashes=", ".join("?" * len(chunk)))
+        result.update(conn.execute(sql, [lang, *chunk]))
+    return result
+
+
+def save_string_translations(entries: list[tuple[str, str, str]]) -> None:
+    """Grava traduções de texto [(src_hash, lang, translated), ...] numa única transação."""
+    if not entries:
+        return
+    ts = int(datetime.now(timezone.utc).timestamp())
+    conn = get_connection()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(SAVE_STRING_TRANSLATION_SQL, [(h, lang, out, ts) for h, lang, out in entries])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
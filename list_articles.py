@@ -5,19 +5,27 @@ Uso: python list_articles.py [--source globaltimes] [--limit 20]
 
 import argparse
 import sys
-from db import get_connection
+from db import get_connection, close_connection
+
+_ENC = sys.stdout.encoding or "utf-8"
+# Terminal UTF-8 (Linux/macOS, Windows Terminal) imprime qualquer texto: sem encode manual
+_NEEDS_SANITIZE = _ENC.lower().replace("-", "") != "utf8"
+# Caracteres removidos antes de imprimir (zero-width space e replacement char)
+_STRIP_TABLE = str.maketrans("", "", "\u200b\ufffd")
 
 
 def _safe_print(s: str) -> None:
     """Imprime string evitando erro de encoding no Windows."""
     if s is None:
         return
-    out = (s.replace("\u200b", "").replace("\ufffd", "") if isinstance(s, str) else str(s))
-    enc = sys.stdout.encoding or "utf-8"
+    out = s.translate(_STRIP_TABLE) if isinstance(s, str) else str(s)
+    if not _NEEDS_SANITIZE:
+        print(out)
+        return
     try:
-        sys.stdout.buffer.write((out + "\n").encode(enc, errors="replace"))
+        sys.stdout.buffer.write((out + "\n").encode(_ENC, errors="replace"))
     except (AttributeError, UnicodeEncodeError):
-        print(out.encode(enc, errors="replace").decode(enc))
+        print(out.encode(_ENC, errors="replace").decode(_ENC))
 
 
 def main():
@@ -27,34 +35,42 @@ def main():
     args = ap.parse_args()
     conn = get_connection()
     try:
-        sql = "SELECT source, url, title, summary, category, published_at, author, scraped_at FROM articles"
+        # Título e resumo já vêm cortados do banco; *_cut indica se havia mais texto
+        sql = """
+            SELECT source, url,
+                substr(title, 1, 80) AS title, length(title) > 80 AS title_cut,
+                substr(summary, 1, 100) AS summary, length(summary) > 100 AS summary_cut,
+                category, published_at, author, scraped_at
+            FROM articles
+        """
         params = []
         if args.source:
             sql += " WHERE source = ?"
             params.append(args.source)
-        sql += " ORDER BY published_at DESC NULLS LAST, id DESC LIMIT ?"
+        # DESC já deixa NULL por último (equivale a NULLS LAST)
+        sql += " ORDER BY published_at DESC, id DESC LIMIT ?"
         params.append(args.limit)
         cur = conn.execute(sql, params)
-        rows = cur.fetchall()
-        cols = [d[0] for d in cur.description]
-        for i, row in enumerate(rows, 1):
-            d = dict(zip(cols, row))
-            title = (d["title"] or "")[:80] + ("..." if len(d["title"] or "") > 80 else "")
-            summary = d["summary"] or ""
-            if len(summary) > 100:
-                summary = summary[:100] + "..."
-            _safe_print(f"\n--- {i} ---")
-            _safe_print("source: " + str(d["source"]))
-            _safe_print("title: " + title)
-            _safe_print("url: " + str(d["url"]))
-            _safe_print("summary: " + summary)
-            _safe_print("category: " + str(d["category"]))
-            _safe_print("published_at: " + str(d["published_at"]))
-            _safe_print("author: " + str(d["author"]))
-            _safe_print("scraped_at: " + str(d["scraped_at"]))
-        print(f"\nTotal exibido: {len(rows)}")
+        n = 0
+        for n, row in enumerate(cur, 1):
+            source, url, title, title_cut, summary, summary_cut, category, published_at, author, scraped_at = row
+            title_disp = (title or "") + ("..." if title_cut else "")
+            summary_disp = (summary or "") + ("..." if summary_cut else "")
+            # Um único write por artigo
+            _safe_print("\n".join([
+                f"\n--- {n} ---",
+                f"source: {source}",
+                "title: " + title_disp,
+                f"url: {url}",
+                "summary: " + summary_disp,
+                f"category: {category}",
+                f"published_at: {published_at}",
+                f"author: {author}",
+                f"scraped_at: {scraped_at}",
+            ]))
+        print(f"\nTotal exibido: {n}")
     finally:
-        conn.close()
+        close_connection()
 
 
 if __name__ == "__main__":
@@ -8,21 +8,40 @@ do artigo e obtém a data de <span class="pub_time">Published: Feb 17, 2026 10:3
 """
 
 import re
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
-from config import USER_AGENT
+from sources.http_session import get_session
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.globaltimes.cn"
 CHINA_INDEX_URL = "https://www.globaltimes.cn/china/index.html"
-FETCH_ARTICLE_DELAY = 0.4  # segundos entre requests às páginas de artigo
+FETCH_ARTICLE_WORKERS = 8  # páginas de artigo baixadas em paralelo (limite de cortesia por host)
+_PAGE_LINK = "a[href*='/page/']"  # fallback: primeiro link para uma página de artigo
+_SOURCE_TIME_SPLIT = re.compile(r"\s*\|\s*")  # 'By Author  |  2026/2/18 21:38:48'
+_PUB_TIME_PREFIX = "Published: "
+
+
+def _parse_slash_datetime(text: str) -> datetime | None:
+    """
+    Converte '2026/2/18 21:38:48' ou '2026/2/18 21:38' (mês/dia sem zero à esquerda) em datetime.
+    Feito à mão: bem mais rápido que strptime para um formato fixo.
+    """
+    try:
+        date_str, time_str = text.split()
+        year, month, day = date_str.split("/")
+        hms = time_str.split(":")
+        if len(hms) not in (2, 3):
+            return None
+        return datetime(int(year), int(month), int(day), *map(int, hms))
+    except ValueError:
+        return None
 
 
 def _parse_source_time(text: str) -> tuple[str | None, datetime | None]:
@@ -32,7 +51,7 @@ def _parse_source_time(text: str) -> tuple[str | None, datetime | None]:
     if not text or not text.strip():
         return None, None
     text = text.strip()
-    parts = re.split(r"\s*\|\s*", text, maxsplit=1)
+    parts = _SOURCE_TIME_SPLIT.split(text, maxsplit=1)
     author = None
     if parts:
         author = parts[0].strip()
@@ -42,14 +61,7 @@ def _parse_source_time(text: str) -> tuple[str | None, datetime | None]:
             author = author[3:].strip()
     pub_dt = None
     if len(parts) > 1:
-        date_str = parts[1].strip()
-        try:
-            pub_dt = datetime.strptime(date_str, "%Y/%m/%d %H:%M:%S")
-        except ValueError:
-            try:
-                pub_dt = datetime.strptime(date_str, "%Y/%m/%d %H:%M")
-            except ValueError:
-                pass
+        pub_dt = _parse_slash_datetime(parts[1])
     return author or None, pub_dt
 
 
@@ -59,46 +71,41 @@ def _normalize_url(href: str) -> str:
     return urljoin(BASE_URL, href.strip()).split("?")[0]
 
 
-def fetch_china_index() -> str:
-    """Baixa o HTML da página China do Global Times."""
-    r = requests.get(
+def fetch_china_index_bytes(session: requests.Session | None = None) -> bytes:
+    """Baixa o HTML da página China do Global Times (bytes; o parser decodifica como UTF-8)."""
+    r = (session or get_session()).get(
         CHINA_INDEX_URL,
-        headers={"User-Agent": USER_AGENT},
         timeout=15,
     )
     r.raise_for_status()
-    r.encoding = r.apparent_encoding or "utf-8"
-    return r.text
+    return r.content
 
 
-def fetch_article_page(url: str) -> str:
-    """Baixa o HTML de uma página de artigo (para obter pub_time)."""
-    r = requests.get(
+def fetch_article_page_bytes(url: str, session: requests.Session | None = None) -> bytes:
+    """Baixa o HTML de uma página de artigo, em bytes (para obter pub_time)."""
+    r = (session or get_session()).get(
         url,
-        headers={"User-Agent": USER_AGENT},
         timeout=15,
     )
     r.raise_for_status()
-    r.encoding = r.apparent_encoding or "utf-8"
-    return r.text
+    return r.content
 
 
-def parse_pub_time_from_article(html: str) -> datetime | None:
+def parse_pub_time_from_article(html: str | bytes) -> datetime | None:
     """
     Extrai data/hora de <span class="pub_time">Published: Feb 17, 2026 10:37 AM</span>.
     Retorna None se não encontrar ou falhar o parse.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    span = soup.find("span", class_="pub_time")
+    span = LexborHTMLParser(html).css_first("span.pub_time")
     if not span:
         return None
-    text = span.get_text(strip=True)
+    text = span.text(strip=True)
     if not text:
         return None
     # "Published: Feb 17, 2026 10:37 AM"
-    prefix = "Published: "
-    if text.startswith(prefix):
-        text = text[len(prefix) :].strip()
+    if text.startswith(_PUB_TIME_PREFIX):
+        text = text[len(_PUB_TIME_PREFIX) :].strip()
+    # Nome do mês em inglês: aqui strptime continua (um artigo por chamada)
     try:
         return datetime.strptime(text, "%b %d, %Y %I:%M %p")
     except ValueError:
@@ -108,35 +115,168 @@ def parse_pub_time_from_article(html: str) -> datetime | None:
             return None
 
 
-def fill_published_at_for_principals(articles: list[dict]) -> None:
+def _fetch_pub_time(url: str, session: requests.Session | None) -> datetime | None:
+    """Baixa a página do artigo e extrai pub_time (executado numa thread do pool)."""
+    return parse_pub_time_from_article(fetch_article_page_bytes(url, session=session))
+
+
+def fill_published_at_for_principals(articles: list[dict], session: requests.Session | None = None) -> None:
     """
     Para cada artigo com is_principal=True e sem published_at, acessa a URL do artigo,
     extrai pub_time e preenche published_at. Altera a lista in-place.
+    As páginas são baixadas em paralelo (até FETCH_ARTICLE_WORKERS ao mesmo tempo).
     """
-    for a in articles:
-        if not a.get("is_principal") or a.get("published_at") is not None:
+    todo = [a for a in articles if a.get("is_principal") and a.get("published_at") is None and a.get("url")]
+    if not todo:
+        return
+    with ThreadPoolExecutor(max_workers=min(FETCH_ARTICLE_WORKERS, len(todo))) as executor:
+        futures = {executor.submit(_fetch_pub_time, a["url"], session): a for a in todo}
+        for future in as_completed(futures):
+            a = futures[future]
+            url = a["url"]
+            try:
+                pub_dt = future.result()
+                if pub_dt is not None:
+                    a["published_at"] = pub_dt
+                    logger.debug("pub_time %s -> %s", url[:50], pub_dt)
+            except Exception as e:
+                logger.warning("Falha ao obter pub_time de %s: %s", url[:60], e)
+
+
+# Blocos da página China. Cada handler recebe o <div> do bloco e a categoria corrente
+# (último column_title visto em china_content) e gera os kwargs de add() dos seus artigos.
+
+def _handle_form1(node, category: str | None):
+    """FORM1 - Feature principal (topo esquerdo)."""
+    link = node.css_first("a.new_title_ml") or node.css_first(_PAGE_LINK)
+    if link:
+        title = link.text(strip=True)
+        url = link.attributes.get("href")
+        p = node.css_first("p")
+        summary = p.text(strip=True) if p else None
+        if title and url:
+            yield {"url": url, "title": title, "summary": summary, "is_principal": True}
+
+
+def _handle_form2(node, category: str | None):
+    """FORM2 - Artigo com imagem (abaixo do form1)."""
+    link = node.css_first("a.new_title_ms") or node.css_first(_PAGE_LINK)
+    if link:
+        title = link.text(strip=True)
+        url = link.attributes.get("href")
+        desc = node.css_first("div.form2_desc")
+        p = desc.css_first("p") if desc else None
+        summary = p.text(strip=True) if p else None
+        if title and url:
+            yield {"url": url, "title": title, "summary": summary, "is_principal": True}
+
+
+def _handle_form3(node, category: str | None):
+    """FORM3 - Artigo simples (abaixo do form2)."""
+    link = node.css_first("a.new_title_ms") or node.css_first(_PAGE_LINK)
+    if link:
+        title = link.text(strip=True)
+        url = link.attributes.get("href")
+        p = node.css_first("p")
+        summary = p.text(strip=True) if p else None
+        if title and url:
+            yield {"url": url, "title": title, "summary": summary, "is_principal": True}
+
+
+def _handle_form4(node, category: str | None):
+    """FORM4 - Artigo de seção com categoria (MILITARY, CHINA GRAPHIC, DIPLOMACY)."""
+    title_link = node.css_first("a.new_title_ms") or node.css_first(_PAGE_LINK)
+    if title_link and title_link.attributes.get("href"):
+        title = title_link.text(strip=True)
+        if not title:
+            title = (title_link.attributes.get("title") or "").strip()
+        if title:
+            p = node.css_first("p")
+            summary = p.text(strip=True) if p else None
+            yield {"url": title_link.attributes["href"], "title": title, "summary": summary, "category": category, "is_principal": True}
+
+
+def _handle_mid_elem(node, category: str | None):
+    """MID_ELEM - Destaque de seção com categoria."""
+    mid_title = node.css_first("div.mid_title")
+    link = mid_title.css_first("a") if mid_title else node.css_first(_PAGE_LINK)
+    if link and link.attributes.get("href"):
+        title = link.text(strip=True)
+        mid_desc = node.css_first("div.mid_desc")
+        summary = mid_desc.text(strip=True) if mid_desc else None
+        if title:
+            yield {"url": link.attributes["href"], "title": title, "summary": summary, "category": category, "is_principal": True}
+
+
+def _handle_content_bottom(node, category: str | None):
+    """CONTENT_BOTTOM - Lista de artigos menores (4 itens)."""
+    for li in node.css("li"):
+        link = li.css_first("a.new_title_ss") or li.css_first(_PAGE_LINK)
+        if link and link.attributes.get("href"):
+            title = link.text(strip=True)
+            if title:
+                yield {"url": link.attributes["href"], "title": title, "is_principal": True}
+
+
+def _handle_list_content(node, category: str | None):
+    """LIST_CONTENT (MORE) - Lista com autor e data; no newsflow só últimas 24h."""
+    level01 = node.css_first("div.level01_list")
+    ul = (level01.css_first("ul") if level01 else node.css_first("ul")) or node
+    for li in ul.css("li"):
+        info = li.css_first("div.list_info")
+        if not info:
             continue
-        url = a.get("url")
-        if not url:
+        link = info.css_first("a.new_title_ms") or info.css_first(_PAGE_LINK)
+        if not link:
             continue
-        try:
-            time.sleep(FETCH_ARTICLE_DELAY)
-            html = fetch_article_page(url)
-            pub_dt = parse_pub_time_from_article(html)
-            if pub_dt is not None:
-                a["published_at"] = pub_dt
-                logger.debug("pub_time %s -> %s", url[:50], pub_dt)
-        except Exception as e:
-            logger.warning("Falha ao obter pub_time de %s: %s", url[:60], e)
-
-
-def parse_china_index(html: str) -> list[dict]:
+        title = link.text(strip=True)
+        url = link.attributes.get("href")
+        p = info.css_first("p")
+        summary = p.text(strip=True) if p else None
+        source_time = info.css_first("div.source_time")
+        author, published_at = None, None
+        if source_time:
+            author, published_at = _parse_source_time(source_time.text())
+        if title and url:
+            yield {"url": url, "title": title, "summary": summary, "published_at": published_at, "author": author, "is_principal": False}
+
+
+# Classe do bloco -> handler, na ordem em que as seções entram na lista de artigos:
+# principais primeiro (form1..content_bottom, sem filtro de 24h) e a MORE por último.
+# Com a mesma URL em duas seções, vale a primeira nessa ordem.
+_BLOCK_HANDLERS = {
+    "china_article_form1": _handle_form1,
+    "china_article_form2": _handle_form2,
+    "china_article_form3": _handle_form3,
+    "china_article_form4": _handle_form4,
+    "mid_elem": _handle_mid_elem,
+    "content_bottom": _handle_content_bottom,
+    "list_content": _handle_list_content,
+}
+_SECTION_OF = {cls: i for i, cls in enumerate(_BLOCK_HANDLERS)}
+_SECTION_OF["mid_elem"] = _SECTION_OF["china_article_form4"]  # form4 e mid_elem se intercalam na mesma seção
+_FIRST_ONLY = {"content_bottom", "list_content"}  # só o primeiro bloco da página
+# Uma única travessia do DOM, em ordem de documento; column_title, form4 e mid_elem só contam dentro de china_content
+_INDEX_BLOCKS = ", ".join([
+    "div.china_article_form1",
+    "div.china_article_form2",
+    "div.china_article_form3",
+    "div.china_content div.column_title",
+    "div.china_content div.china_article_form4",
+    "div.china_content div.mid_elem",
+    "div.content_bottom",
+    "div.list_content",
+])
+
+
+def parse_china_index(html: str | bytes, session: requests.Session | None = None) -> list[dict]:
     """
     Extrai da página China todos os artigos com:
     title, url, summary, category, published_at, author.
     Coleta TODAS as seções visíveis na página.
+    `session` é usada para buscar a data nas páginas dos artigos principais.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
     articles: list[dict] = []
     seen_urls: set[str] = set()
 
@@ -155,108 +295,31 @@ def parse_china_index(html: str) -> list[dict]:
             "is_principal": is_principal,
         })
 
-    # Notícias principais (fora da MORE): form1, form2, form3, form4, mid_elem, content_bottom
-    # Essas vêm primeiro no newsflow e não têm filtro de 24h.
-
-    # 1) FORM1 - Feature principal (topo esquerdo)
-    for form1 in soup.find_all("div", class_="china_article_form1"):
-        link = form1.find("a", class_="new_title_ml") or form1.find("a", href=re.compile(r"/page/"))
-        if link:
-            title = link.get_text(strip=True)
-            url = link.get("href")
-            p = form1.find("p")
-            summary = p.get_text(strip=True) if p else None
-            if title and url:
-                add(url, title, summary=summary, is_principal=True)
-
-    # 2) FORM2 - Artigo com imagem (abaixo do form1)
-    for form2 in soup.find_all("div", class_="china_article_form2"):
-        link = form2.find("a", class_="new_title_ms") or form2.find("a", href=re.compile(r"/page/"))
-        if link:
-            title = link.get_text(strip=True)
-            url = link.get("href")
-            desc = form2.find("div", class_="form2_desc")
-            summary = desc.find("p").get_text(strip=True) if desc and desc.find("p") else None
-            if title and url:
-                add(url, title, summary=summary, is_principal=True)
-
-    # 3) FORM3 - Artigo simples (abaixo do form2)
-    for form3 in soup.find_all("div", class_="china_article_form3"):
-        link = form3.find("a", class_="new_title_ms") or form3.find("a", href=re.compile(r"/page/"))
-        if link:
-            title = link.get_text(strip=True)
-            url = link.get("href")
-            p = form3.find("p")
-            summary = p.get_text(strip=True) if p else None
-            if title and url:
-                add(url, title, summary=summary, is_principal=True)
-
-    # 4) FORM4 + MID_ELEM - Seções com categoria (MILITARY, CHINA GRAPHIC, DIPLOMACY)
-    china_content = soup.find("div", class_="china_content")
-    if china_content:
-        current_category = None
-        for elem in china_content.find_all(["div"], recursive=True):
-            classes = elem.get("class", [])
-            if "column_title" in classes:
-                a = elem.find("a")
-                if a:
-                    current_category = a.get_text(strip=True)
-                continue
-            if "china_article_form4" in classes:
-                title_link = elem.find("a", class_="new_title_ms")
-                if not title_link:
-                    title_link = elem.find("a", href=re.compile(r"/page/"))
-                if title_link and title_link.get("href"):
-                    title = title_link.get_text(strip=True)
-                    if not title:
-                        title = (title_link.get("title") or "").strip()
-                    if title:
-                        p = elem.find("p")
-                        summary = p.get_text(strip=True) if p else None
-                        add(title_link.get("href"), title, summary=summary, category=current_category, is_principal=True)
-            elif "mid_elem" in classes:
-                mid_title = elem.find("div", class_="mid_title")
-                link = mid_title.find("a") if mid_title else elem.find("a", href=re.compile(r"/page/"))
-                if link and link.get("href"):
-                    title = link.get_text(strip=True)
-                    url = link.get("href")
-                    mid_desc = elem.find("div", class_="mid_desc")
-                    summary = mid_desc.get_text(strip=True) if mid_desc else None
-                    if title:
-                        add(url, title, summary=summary, category=current_category, is_principal=True)
-
-    # 5) CONTENT_BOTTOM - Lista de artigos menores (4 itens)
-    content_bottom = soup.find("div", class_="content_bottom")
-    if content_bottom:
-        for li in content_bottom.find_all("li"):
-            link = li.find("a", class_="new_title_ss") or li.find("a", href=re.compile(r"/page/"))
-            if link and link.get("href"):
-                title = link.get_text(strip=True)
-                if title:
-                    add(link.get("href"), title, is_principal=True)
-
-    # 6) LIST_CONTENT (MORE) - Lista com autor e data; no newsflow só últimas 24h
-    list_content = soup.find("div", class_="list_content")
-    if list_content:
-        level01 = list_content.find("div", class_="level01_list")
-        ul = (level01.find("ul") if level01 else list_content.find("ul")) or list_content
-        for li in ul.find_all("li"):
-            info = li.find("div", class_="list_info")
-            if not info:
-                continue
-            link = info.find("a", class_="new_title_ms") or info.find("a", href=re.compile(r"/page/"))
-            if not link:
+    # Uma passada pela página; os itens ficam agrupados por seção e só são adicionados
+    # no final, na ordem de _BLOCK_HANDLERS.
+    sections: list[list[dict]] = [[] for _ in _BLOCK_HANDLERS]
+    seen_blocks: set[str] = set()
+    current_category = None
+    for node in tree.css(_INDEX_BLOCKS):
+        classes = (node.attributes.get("class") or "").split()
+        if "column_title" in classes:
+            a = node.css_first("a")
+            if a:
+                current_category = a.text(strip=True)
+            continue
+        for cls, handler in _BLOCK_HANDLERS.items():
+            if cls not in classes:
                 continue
-            title = link.get_text(strip=True)
-            url = link.get("href")
-            p = info.find("p")
-            summary = p.get_text(strip=True) if p else None
-            source_time = info.find("div", class_="source_time")
-            author, published_at = None, None
-            if source_time:
-                author, published_at = _parse_source_time(source_time.get_text())
-            if title and url:
-                add(url, title, summary=summary, published_at=published_at, author=author, is_principal=False)
+            if cls in _FIRST_ONLY:
+                if cls in seen_blocks:
+                    break
+                seen_blocks.add(cls)
+            sections[_SECTION_OF[cls]].extend(handler(node, current_category))
+            break
+
+    for items in sections:
+        for item in items:
+            add(**item)
 
     logger.info("Global Times China: parsed %d articles from all sections", len(articles))
 
@@ -264,12 +327,12 @@ def parse_china_index(html: str) -> list[dict]:
     principals_without_date = [a for a in articles if a.get("is_principal") and a.get("published_at") is None]
     if principals_without_date:
         logger.info("Buscando data de publicação em %d artigos (página do link)...", len(principals_without_date))
-        fill_published_at_for_principals(articles)
+        fill_published_at_for_principals(articles, session=session)
 
     return articles
 
 
-def collect_globaltimes_china() -> list[dict]:
+def collect_globaltimes_china(session: requests.Session | None = None) -> list[dict]:
     """Baixa a página China do Global Times e retorna lista de artigos (com published_at quando possível)."""
-    html = fetch_china_index()
-    return parse_china_index(html)
+    content = fetch_china_index_bytes(session=session)
+    return parse_china_index(content, session=session)
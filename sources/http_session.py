@@ -0,0 +1,53 @@
+"""
+Sessão HTTP compartilhada pelos coletores.
+
+Uma única requests.Session por processo: reaproveita conexões TCP/TLS (keep-alive) entre
+as requisições ao mesmo host, com User-Agent padrão e retry com Retry-After em 429/5xx.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import USER_AGENT
+
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """Cria a sessão com headers padrão e pool de conexões por host."""
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    # 429/503: espera o Retry-After do servidor (ou backoff exponencial) antes de tentar de novo
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Retorna a sessão compartilhada (criada na primeira chamada)."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _build_session()
+        return _SESSION
+
+
+def close_session() -> None:
+    """Fecha a sessão compartilhada (a próxima chamada a get_session recria)."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
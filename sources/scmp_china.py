@@ -17,15 +17,21 @@ from urllib.parse import urljoin
 from zoneinfo import ZoneInfo
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
-from config import USER_AGENT
+from sources.http_session import get_session
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.scmp.com"
 LIST_URL = "https://www.scmp.com/news/china"
 TZ_HONG_KONG = ZoneInfo("Asia/Hong_Kong")
+# "X minute(s) ago", "X hour(s) ago", "X day(s) ago"
+_REL_TIME_RE = re.compile(r"(\d+)\s*(minute|hour|day)s?\s+ago")
+_HEADLINE_OR_TIME = (
+    'span[data-qa="ContentHeadline-Headline"], '
+    'time[data-qa="ContentActionBar-handleRenderDisplayDateTime-time"]'
+)
 
 
 def _normalize_url(href: str) -> str:
@@ -42,8 +48,9 @@ def _parse_datetime_attr(dt_iso: str | None) -> datetime | None:
     try:
         return datetime.fromisoformat(s).replace(tzinfo=timezone.utc)
     except ValueError:
+        # Fração de segundo fora do padrão (ex.: 2 dígitos): fica só até os segundos
         try:
-            return datetime.strptime(dt_iso[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+            return datetime.fromisoformat(s[:19]).replace(tzinfo=timezone.utc)
         except ValueError:
             return None
 
@@ -56,8 +63,7 @@ def _parse_relative_time(text: str, now_hk: datetime) -> datetime | None:
     if not text or not text.strip():
         return None
     text = text.strip().lower()
-    # "X minute(s) ago", "X hour(s) ago", "X day(s) ago"
-    m = re.match(r"(\d+)\s*(minute|hour|day)s?\s+ago", text)
+    m = _REL_TIME_RE.match(text)
     if not m:
         return None
     n = int(m.group(1))
@@ -79,72 +85,81 @@ def _parse_relative_time(text: str, now_hk: datetime) -> datetime | None:
 
 def _published_at_from_time_el(time_el, now_hk: datetime) -> datetime | None:
     """Obtém published_at a partir do elemento <time>: preferir datetime; senão, texto relativo (HK)."""
-    dt_iso = time_el.get("datetime")
+    dt_iso = time_el.attributes.get("datetime")
     if dt_iso:
         return _parse_datetime_attr(dt_iso)
-    text = time_el.get_text(strip=True)
+    text = time_el.text(strip=True)
     return _parse_relative_time(text, now_hk)
 
 
-def fetch_china_page() -> str:
-    """Baixa o HTML da página China do SCMP."""
-    r = requests.get(
+def _parent_link(node):
+    """Primeiro ancestral <a> do nó (o link que envolve o headline), ou None."""
+    node = node.parent
+    while node is not None and node.tag != "a":
+        node = node.parent
+    return node
+
+
+def fetch_china_page_bytes(session: requests.Session | None = None) -> bytes:
+    """Baixa o HTML da página China do SCMP (bytes; o parser decodifica como UTF-8)."""
+    r = (session or get_session()).get(
         LIST_URL,
-        headers={"User-Agent": USER_AGENT},
         timeout=15,
     )
     r.raise_for_status()
-    r.encoding = r.apparent_encoding or "utf-8"
-    return r.text
+    return r.content
 
 
-def parse_china_page(html: str) -> list[dict]:
+def parse_china_page(html: str | bytes) -> list[dict]:
     """
     Extrai artigos: título, url, summary, category, published_at.
     Headlines em span[data-qa="ContentHeadline-Headline"], resumo em h3[data-qa="ContentSummary-ContainerWithTag"],
     categoria em a[data-qa="BaseLink-renderAnchor-StyledAnchor"], time em time[data-qa="ContentActionBar-handleRenderDisplayDateTime-time"].
-    Emparelha por índice; quando o texto do time for relativo, usa horário de Hong Kong no momento da coleta.
+    Cada headline fica com o primeiro time que aparece depois dele (antes do próximo headline);
+    quando o texto do time for relativo, usa horário de Hong Kong no momento da coleta.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
     now_hk = datetime.now(TZ_HONG_KONG)
 
-    headlines = soup.find_all("span", attrs={"data-qa": "ContentHeadline-Headline"})
-    time_els = soup.find_all("time", attrs={"data-qa": "ContentActionBar-handleRenderDisplayDateTime-time"})
+    # Uma passada em ordem de documento: [span do headline, time ou None]
+    cards: list[list] = []
+    for node in tree.css(_HEADLINE_OR_TIME):
+        if node.tag == "span":
+            cards.append([node, None])
+        elif cards and cards[-1][1] is None:
+            cards[-1][1] = node
 
     articles = []
-    n = min(len(headlines), len(time_els))
     seen_urls = set()
 
-    for i in range(n):
-        span = headlines[i]
-        time_el = time_els[i]
-        a = span.find_parent("a")
-        if not a or not a.get("href"):
+    for span, time_el in cards:
+        a = _parent_link(span)
+        if not a or not a.attributes.get("href"):
             continue
-        href = a.get("href", "").strip()
-        title = span.get_text(strip=True)
+        href = a.attributes["href"].strip()
+        title = span.text(strip=True)
         if not title:
             continue
         url = _normalize_url(href)
         if url in seen_urls:
             continue
         seen_urls.add(url)
-        published_at = _published_at_from_time_el(time_el, now_hk)
+        published_at = _published_at_from_time_el(time_el, now_hk) if time_el is not None else None
         if published_at and published_at.tzinfo:
             # Guardar em UTC como naive ISO para o banco (compatível com o resto do pipeline)
             published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
         
         # Buscar resumo e categoria no mesmo container pai do link
-        container = a.find_parent() if a else None
+        container = a.parent
         summary = None
         category = "China"
         if container:
-            summary_el = container.find("h3", attrs={"data-qa": "ContentSummary-ContainerWithTag"})
+            summary_el = container.css_first('h3[data-qa="ContentSummary-ContainerWithTag"]')
             if summary_el:
-                summary = summary_el.get_text(strip=True)
-            cat_link = container.find("a", attrs={"data-qa": "BaseLink-renderAnchor-StyledAnchor"})
+                summary = summary_el.text(strip=True)
+            cat_link = container.css_first('a[data-qa="BaseLink-renderAnchor-StyledAnchor"]')
             if cat_link:
-                category = cat_link.get_text(strip=True) or "China"
+                category = cat_link.text(strip=True) or "China"
         
         articles.append({
             "url": url,
@@ -160,7 +175,7 @@ def parse_china_page(html: str) -> list[dict]:
     return articles
 
 
-def collect_scmp_china() -> list[dict]:
+def collect_scmp_china(session: requests.Session | None = None) -> list[dict]:
     """Baixa a página China do SCMP e retorna artigos no formato do banco."""
-    html = fetch_china_page()
-    return parse_china_page(html)
+    content = fetch_china_page_bytes(session=session)
+    return parse_china_page(content)
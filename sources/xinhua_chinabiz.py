@@ -11,9 +11,9 @@ from datetime import datetime
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
-from config import USER_AGENT
+from sources.http_session import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -24,17 +24,21 @@ SOURCE_ID = "xinhua_chinabiz"
 
 
 def _parse_published_time(text: str) -> datetime | None:
-    """Converte '2026-02-18 16:20:00' em datetime."""
+    """
+    Converte '2026-02-18 16:20:00' ou '2026-2-18 16:20' (com ou sem zero à esquerda) em datetime.
+    Feito à mão: bem mais rápido que strptime e aceita o mesmo formato.
+    """
     if not text or not text.strip():
         return None
-    text = text.strip()
     try:
-        return datetime.strptime(text[:19], "%Y-%m-%d %H:%M:%S")
-    except ValueError:
-        try:
-            return datetime.strptime(text[:16], "%Y-%m-%d %H:%M")
-        except ValueError:
+        date_str, time_str = text.split()[:2]
+        year, month, day = date_str.split("-")
+        hms = time_str.split(":")
+        if len(hms) not in (2, 3):
             return None
+        return datetime(int(year), int(month), int(day), *map(int, hms))
+    except ValueError:
+        return None
 
 
 def _normalize_url(href: str) -> str:
@@ -43,38 +47,35 @@ def _normalize_url(href: str) -> str:
     return urljoin(BASE_URL_FOR_LINKS, href.strip()).split("?")[0]
 
 
-def fetch_china_biz_list() -> str:
-    """Baixa o HTML da lista China-Biz."""
-    r = requests.get(
+def fetch_china_biz_list_bytes(session: requests.Session | None = None) -> bytes:
+    """Baixa o HTML da lista China-Biz (bytes; o parser decodifica como UTF-8)."""
+    r = (session or get_session()).get(
         LIST_URL,
-        headers={"User-Agent": USER_AGENT},
         timeout=15,
     )
     r.raise_for_status()
-    r.encoding = r.apparent_encoding or "utf-8"
-    return r.text
+    return r.content
 
 
-def parse_china_biz_list(html: str) -> list[dict]:
+def parse_china_biz_list(html: str | bytes) -> list[dict]:
     """
     Extrai da página China-Biz os itens com:
     title, url, summary (None), category, published_at, author (None).
     Cada entrada é um <a target="_blank"> com título e um <span class="time"> na mesma ordem.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
     articles: list[dict] = []
 
     link_nodes = [
         a
-        for a in soup.find_all("a", href=True, target="_blank")
-        if a.get_text(strip=True) and a.get_text(strip=True) != "More"
+        for a in tree.css('a[href][target="_blank"]')
+        if a.text(strip=True) and a.text(strip=True) != "More"
     ]
-    time_nodes = soup.find_all("span", class_="time")
-    time_texts = [n.get_text(strip=True) for n in time_nodes]
+    time_texts = [n.text(strip=True) for n in tree.css("span.time")]
 
     for i, a in enumerate(link_nodes):
-        href = a.get("href", "").strip()
-        title = a.get_text(strip=True)
+        href = (a.attributes["href"] or "").strip()
+        title = a.text(strip=True)
         if not title or not href:
             continue
         url = _normalize_url(href)
@@ -93,7 +94,7 @@ def parse_china_biz_list(html: str) -> list[dict]:
     return articles
 
 
-def collect_xinhua_chinabiz() -> list[dict]:
+def collect_xinhua_chinabiz(session: requests.Session | None = None) -> list[dict]:
     """Baixa a lista China-Biz e retorna artigos no formato do banco."""
-    html = fetch_china_biz_list()
-    return parse_china_biz_list(html)
+    content = fetch_china_biz_list_bytes(session=session)
+    return parse_china_biz_list(content)
@@ -1,32 +1,140 @@
 """
 Tradução de título e resumo para português (EN/ZH → PT).
-Usa deep-translator (Google) com cache e pequeno delay para evitar rate limit.
+Usa deep-translator (Google) com cache (memória + banco) e textos traduzidos em paralelo.
 """
 
 from __future__ import annotations
 
+import hashlib
+import re
+import sqlite3
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Mapping, Optional
 
-# Cache: texto original -> texto traduzido (evita repetir mesma frase)
-_cache: dict[str, str] = {}
+from db import get_string_translations, get_translations, save_string_translations, save_translations
+
+# Cache em memória: (idioma, texto original) -> texto traduzido (evita repetir mesma frase no
+# processo). Atrás dele fica o cache persistente do banco (tabela translation_strings).
+_cache: dict[tuple[str, str], str] = {}
+# Chaves de _cache cuja tradução falhou (guardam o original): não vão para o banco
+_failed: set[tuple[str, str]] = set()
+
+# Fronteira de frase: . ? ! + espaço, antes de maiúscula, dígito ou aspas
+# (evita cortar em abreviações como "U.S. officials")
+_SENTENCE_SPLIT = re.compile(r"(?<=[.?!])\s+(?=[A-Z0-9\"“'‘(])")
+
+TRANSLATE_WORKERS = 8  # traduções simultâneas (no máximo, somando todos os pools)
+TRANSLATE_RETRIES = 3
+TRANSLATE_BACKOFF = 0.5  # segundos; dobra a cada nova tentativa
+
+_TRANSLATE_SLOTS = threading.BoundedSemaphore(TRANSLATE_WORKERS)
+# GoogleTranslator guarda os parâmetros da requisição na instância: uma por thread
+_local = threading.local()
+
+
+def _translator(target: str):
+    """Instância de GoogleTranslator da thread atual para o idioma destino."""
+    translators = getattr(_local, "translators", None)
+    if translators is None:
+        translators = _local.translators = {}
+    if target not in translators:
+        from deep_translator import GoogleTranslator
+        translators[target] = GoogleTranslator(source="auto", target=target)
+    return translators[target]
+
+
+def _remote_translate(text: str, target: str) -> str | None:
+    """Traduz um texto, com retry e backoff exponencial; None em caso de erro ou resposta vazia."""
+    for attempt in range(TRANSLATE_RETRIES):
+        try:
+            with _TRANSLATE_SLOTS:
+                out = _translator(target).translate(text)
+        except ImportError:
+            return None
+        except Exception:
+            if attempt + 1 < TRANSLATE_RETRIES:
+                time.sleep(TRANSLATE_BACKOFF * 2**attempt)
+            continue
+        return out.strip() if out and out.strip() else None
+    return None
+
+
+def _sentences(text: str) -> list[str]:
+    """Divide o texto em frases (fim em . ? ! seguido de espaço e maiúscula/aspas)."""
+    return [s for s in _SENTENCE_SPLIT.split(text) if s]
+
+
+def _translate_units(units, target: str) -> None:
+    """
+    Garante que todas as unidades (frases, já sem espaços nas pontas) estejam em _cache.
+    Unidades repetidas são traduzidas uma vez; as que já estão no banco não vão ao tradutor,
+    e as demais são traduzidas em paralelo.
+    """
+    pending = list(dict.fromkeys(t for t in units if t and (target, t) not in _cache))
+    if not pending:
+        return
+    hashes = {t: _src_hash(t) for t in pending}
+    try:
+        saved = get_string_translations(list(hashes.values()), target)
+    except sqlite3.OperationalError:
+        # Banco sem translation_strings (init_db não rodou): fica só o cache em memória
+        saved = {}
+    misses = []
+    for t in pending:
+        hit = saved.get(hashes[t])
+        if hit is not None:
+            _cache[(target, t)] = hit
+        else:
+            misses.append(t)
+    if not misses:
+        return
+    entries = []
+    with ThreadPoolExecutor(max_workers=min(TRANSLATE_WORKERS, len(misses))) as executor:
+        futures = {executor.submit(_remote_translate, t, target): t for t in misses}
+        for future in as_completed(futures):
+            t = futures[future]
+            out = future.result()
+            # Falha: devolve o original, sem gravar no banco (tenta de novo no próximo processo)
+            _cache[(target, t)] = out or t
+            if out:
+                entries.append((hashes[t], target, out))
+            else:
+                _failed.add((target, t))
+    try:
+        save_string_translations(entries)
+    except sqlite3.OperationalError:
+        pass  # sem a tabela, as traduções ficam só em _cache
+
+
+def _translate_many(texts, target: str = "pt") -> None:
+    """
+    Garante que todos os textos (já sem espaços nas pontas) estejam em _cache.
+    Cada texto é traduzido frase a frase: frases já vistas (em outro resumo, no título do
+    mesmo artigo, em execuções anteriores) vêm do cache e só as novas vão ao tradutor.
+    """
+    pending = list(dict.fromkeys(t for t in texts if t and (target, t) not in _cache))
+    if not pending:
+        return
+    split = {t: _sentences(t) for t in pending}
+    _translate_units((s for parts in split.values() for s in parts), target)
+    for t, parts in split.items():
+        _cache[(target, t)] = " ".join(_cache[(target, s)] for s in parts)
+        if any((target, s) in _failed for s in parts):
+            _failed.add((target, t))
+
+
+def _translation_failed(text: Optional[str], target: str = "pt") -> bool:
+    """True se o texto (ou alguma frase dele) ficou sem tradução neste processo."""
+    return bool(text) and (target, text.strip()) in _failed
 
 
 def _translate(text: str, target: str = "pt") -> str:
     if not text or not (t := text.strip()):
         return text or ""
-    if t in _cache:
-        return _cache[t]
-    try:
-        from deep_translator import GoogleTranslator
-        out = GoogleTranslator(source="auto", target=target).translate(t)
-        if out and out.strip():
-            _cache[t] = out.strip()
-            return _cache[t]
-    except Exception:
-        pass
-    _cache[t] = t
-    return t
+    _translate_many([t], target)
+    return _cache[(target, t)]
 
 
 def translate_to_portuguese(text: Optional[str]) -> str:
@@ -36,24 +144,69 @@ def translate_to_portuguese(text: Optional[str]) -> str:
     return _translate(text)
 
 
-def translate_article_row(row: tuple, delay_seconds: float = 0.2) -> tuple:
+def translate_article_row(row: Mapping) -> dict:
+    """
+    Recebe uma linha do newsflow (sqlite3.Row ou dict com source, url, title, summary, ...)
+    e retorna um dict com as mesmas colunas e title/summary traduzidos para português.
+    """
+    title_pt = translate_to_portuguese(row["title"])
+    summary_pt = translate_to_portuguese(row["summary"]) if row["summary"] else ""
+    return {**dict(row), "title": title_pt, "summary": summary_pt}
+
+
+def translate_newsflow_rows(rows: list[Mapping]) -> list[dict]:
     """
-    Recebe uma linha (source, url, title, summary, category, published_at, author, is_principal)
-    e retorna a mesma estrutura com title e summary traduzidos para português.
+    Traduz título e summary de cada linha para português. Mantém cache entre chamadas.
+    Os textos distintos de todas as linhas são traduzidos antes, de uma vez.
     """
-    source, url, title, summary, category, published_at, author, is_principal = row
-    title_pt = translate_to_portuguese(title)
-    time.sleep(delay_seconds)
-    summary_pt = translate_to_portuguese(summary) if summary else ""
-    time.sleep(delay_seconds)
-    return (source, url, title_pt, summary_pt, category, published_at, author, is_principal)
+    _translate_many(
+        t for r in rows for field in ("title", "summary") if r[field] and (t := r[field].strip())
+    )
+    return [translate_article_row(r) for r in rows]
+
+
+def _src_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
 
 
-def translate_newsflow_rows(rows: list[tuple], delay_seconds: float = 0.2) -> list[tuple]:
-    """Traduz título e summary de cada linha para português. Mantém cache entre chamadas."""
-    out = []
+def _saved_translation(saved: dict, source: str, url: str, field: str, original: Optional[str]) -> Optional[str]:
+    """Tradução salva para o campo se o original não mudou; "" para campo vazio; None se precisa traduzir."""
+    if not original:
+        return ""
+    hit = saved.get((source, url, field))
+    if hit is None or hit[0] != _src_hash(original):
+        return None
+    return hit[1]
+
+
+def translate_newsflow_rows_cached(rows: list[Mapping]) -> list[dict]:
+    """
+    Como translate_newsflow_rows, mas reaproveita traduções gravadas no banco (tabela translations).
+    Só linhas com título/resumo novo ou alterado passam pelo tradutor; o resultado é salvo.
+    """
+    saved = get_translations([(r["source"], r["url"]) for r in rows])
+    out: list[dict | None] = []
+    misses: list[tuple[int, Mapping]] = []
     for i, r in enumerate(rows):
-        out.append(translate_article_row(r, delay_seconds=delay_seconds))
-        if (i + 1) % 5 == 0:
-            time.sleep(0.5)  # pausa extra a cada 5 para evitar limite
+        source, url = r["source"], r["url"]
+        title_pt = _saved_translation(saved, source, url, "title", r["title"])
+        summary_pt = _saved_translation(saved, source, url, "summary", r["summary"])
+        if title_pt is None or summary_pt is None:
+            out.append(None)
+            misses.append((i, r))
+        else:
+            out.append({**dict(r), "title": title_pt, "summary": summary_pt})
+
+    if misses:
+        translated = translate_newsflow_rows([r for _, r in misses])
+        entries = []
+        for (i, r), t in zip(misses, translated):
+            out[i] = t
+            source, url = r["source"], r["url"]
+            # Só grava campos traduzidos de fato; os que caíram no original tentam de novo depois
+            if r["title"] and not _translation_failed(r["title"]):
+                entries.append((source, url, "title", _src_hash(r["title"]), t["title"]))
+            if r["summary"] and not _translation_failed(r["summary"]):
+                entries.append((source, url, "summary", _src_hash(r["summary"]), t["summary"]))
+        save_translations(entries)
     return out